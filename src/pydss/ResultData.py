@@ -6,6 +6,7 @@ import os
 
 import opendssdirect as dss
 from loguru import logger
+import numpy as np
 import pandas as pd
 
 from pydss.unitDefinations import unit_info
@@ -455,10 +456,12 @@ class ResultData:
             if name in profiles:
                 sinterval = dss.LoadShape.SInterval()
                 assert sim_resolution >= sinterval, f"{sim_resolution} >= {sinterval}"
-                df = create_loadshape_pmult_dataframe_for_simulation(self._settings)
-                sum_values = df.iloc[:, 0].sum()
+                # Exported values keep the full precision of the OpenDSS loadshape.
+                df = create_loadshape_pmult_dataframe_for_simulation(self._settings, dtype=np.float64)
+                pmult = df.iloc[:, 0].to_numpy()
+                sum_values = float(pmult.sum())
                 if granularity in per_time_point:
-                    load_shape_data[name] = df.iloc[:, 0].values
+                    load_shape_data[name] = pmult
                     pmult_sums[name] = sum_values
                 else:
                     pmult_sums[name] = sum_values
@@ -49,7 +49,8 @@ def get_snapshot_timepoint(settings: SimulationSettingsModel, mode: SnapshotTime
         profile_name = dss.Properties.Value('yearly')
         dss.LoadShape.Name(profile_name)
         if profile_name not in pv_shapes.keys():
-            pv_shapes[profile_name] = create_loadshape_pmult_dataframe_for_simulation(settings)
+            # Upcast so the profiles are aggregated in double precision.
+            pv_shapes[profile_name] = create_loadshape_pmult_dataframe_for_simulation(settings).astype(np.float64)
         if len(aggregate_profiles) == 0:
             aggregate_profiles['PV'] = (pv_shapes[profile_name] * pmpp)[0]
             aggregate_profiles = aggregate_profiles.replace(np.nan, 0)
@@ -66,7 +67,8 @@ def get_snapshot_timepoint(settings: SimulationSettingsModel, mode: SnapshotTime
         profile_name = dss.Properties.Value('yearly')
         dss.LoadShape.Name(profile_name)
         if profile_name not in load_shapes.keys():
-            load_shapes[profile_name] = create_loadshape_pmult_dataframe_for_simulation(settings)
+            # Upcast so the profiles are aggregated in double precision.
+            load_shapes[profile_name] = create_loadshape_pmult_dataframe_for_simulation(settings).astype(np.float64)
         if len(aggregate_profiles) == 0:
             aggregate_profiles['Load'] = (load_shapes[profile_name] * kw)[0]
         else:
@@ -135,7 +135,7 @@ class PvVoltageRideThru(ControllerAbstract):
         ]
         uv_trip_region = Polygon([[p.y, p.x] for p in UVtripPoints])
 
-        if self.model.ride_through_category == RideThroughCategory.CATEGORY_I:
+        if self.model.ride_through_category is RideThroughCategory.CATEGORY_I:
             ov2pu_eq = 1.20
             ov2sec_eq = 0.16
             ov1pu_min = 1.1
@@ -156,7 +156,7 @@ class PvVoltageRideThru(ControllerAbstract):
             self._fault_counter_max = 2
             self._fault_counter_clearing_time_sec = 20
 
-        elif self.model.ride_through_category == RideThroughCategory.CATEGORY_II:
+        elif self.model.ride_through_category is RideThroughCategory.CATEGORY_II:
             ov2pu_eq = 1.20
             ov2sec_eq = 0.16
             ov1pu_min = 1.1
@@ -177,7 +177,7 @@ class PvVoltageRideThru(ControllerAbstract):
             self._fault_counter_max = 2
             self._fault_counter_clearing_time_sec = 10
 
-        elif self.model.ride_through_category == RideThroughCategory.CATEGORY_I:
+        elif self.model.ride_through_category is RideThroughCategory.CATEGORY_III:
             ov2pu_eq = 1.20
             ov2sec_eq = 0.16
             ov1pu_min = 1.1
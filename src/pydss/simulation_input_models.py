@@ -1,6 +1,7 @@
 """Defines user input models for a simulation."""
 
 import enum
+import functools
 import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -27,6 +28,18 @@ from pydss.dataset_buffer import DEFAULT_MAX_CHUNK_BYTES
 from pydss.utils.utils import dump_data, load_data
 from pydss.common import DATE_FORMAT
 
+
+@functools.lru_cache(maxsize=64)
+def _parse_datetime(value: str) -> datetime:
+    """Parse a timestamp string from the simulation settings.
+
+    Results are cached because the same settings are loaded repeatedly.
+    """
+    if "T" in value:
+        return datetime.fromisoformat(value)
+    return datetime.strptime(value, DATE_FORMAT)
+
+
 class InputsBaseModel(BaseModel):
     """Base class for all input models"""
     model_config = ConfigDict(title="InputsBaseModel", str_strip_whitespace=True, validate_assignment=True, validate_default=True, extra="forbid", use_enum_values=False, populate_by_name=True)
@@ -72,10 +85,7 @@ class SnapshotTimePointSelectionConfigModel(InputsBaseModel):
     @classmethod
     def double(cls, v: str) -> str:
         if isinstance(v, str):
-            if "T" in v:
-                v = datetime.fromisoformat(v)
-            else: 
-                v = datetime.strptime(v, DATE_FORMAT)
+            v = _parse_datetime(v)
         return v 
 
 class ScenarioPostProcessModel(InputsBaseModel):
@@ -319,10 +329,7 @@ class ProjectModel(InputsBaseModel):
     @classmethod
     def double(cls, v: str) -> str:
         if isinstance(v, str):
-            if "T" in v:
-                v = datetime.fromisoformat(v)
-            else: 
-                v = datetime.strptime(v, DATE_FORMAT)
+            v = _parse_datetime(v)
         return v 
     
     @model_validator(mode="before")
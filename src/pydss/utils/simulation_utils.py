@@ -14,17 +14,53 @@ class CircularBufferHelper:
     def __init__(self, window_size):
         self._buf = deque(maxlen=window_size)
         self._window_size = window_size
+        self._running_sum = 0.0
+        self._appends_since_sum = 0
+        # Ring buffer for list values, allocated on the first append.
+        self._np_buf = None
+        self._head = 0
+        self._count = 0
 
     def __len__(self):
+        if self._np_buf is not None:
+            return self._count
         return len(self._buf)
 
     def append(self, val):
+        if self._np_buf is not None or isinstance(val, (list, tuple, np.ndarray)):
+            self._append_array(val)
+            return
+
+        if len(self._buf) == self._window_size:
+            self._running_sum -= self._buf[0]
         self._buf.append(val)
+        self._running_sum += val
+        self._appends_since_sum += 1
+        # Recompute from the window once per window length to bound floating-point
+        # drift, and immediately if a NaN has entered the sum.
+        if self._appends_since_sum >= self._window_size or self._running_sum != self._running_sum:
+            self._running_sum = sum(self._buf)
+            self._appends_since_sum = 0
+
+    def _append_array(self, val):
+        if self._np_buf is None:
+            val = np.asarray(val)
+            dtype = np.result_type(val.dtype, np.float64)
+            self._np_buf = np.empty((self._window_size, len(val)), dtype=dtype)
+        self._np_buf[self._head] = val
+        self._head = (self._head + 1) % self._window_size
+        if self._count < self._window_size:
+            self._count += 1
 
     def average(self):
+        if self._np_buf is not None:
+            if self._count < self._window_size:
+                return np.full(self._np_buf.shape[1], np.NaN)
+            return self._np_buf.mean(axis=0)
+
         if len(self._buf) < self._window_size:
             return np.NaN
-        return sum(self._buf) / len(self._buf)
+        return self._running_sum / len(self._buf)
 
 
 class SimulationFilteredTimeRange:
@@ -127,6 +163,11 @@ def create_time_range_from_settings(settings: SimulationSettingsModel):
     return start_time, end_time, step_time
 
 
+def _get_num_time_points(start_time, end_time, step_time):
+    """Return the number of time points in [start_time, end_time) at step_time."""
+    return max(0, -(-(end_time - start_time) // step_time))
+
+
 def create_datetime_index_from_settings(settings: SimulationSettingsModel):
     """Return time indices created from the simulation settings.
 
@@ -140,43 +181,37 @@ def create_datetime_index_from_settings(settings: SimulationSettingsModel):
 
     """
     start_time, end_time, step_time = create_time_range_from_settings(settings)
-    data = []
-    cur_time = start_time
-    while cur_time < end_time:
-        data.append(cur_time)
-        cur_time += step_time
+    num_points = _get_num_time_points(start_time, end_time, step_time)
+    return pd.date_range(start=start_time, periods=num_points, freq=step_time)
 
-    return pd.DatetimeIndex(data)
 
-
-def create_loadshape_pmult_dataframe(settings: SimulationSettingsModel):
+def create_loadshape_pmult_dataframe(settings: SimulationSettingsModel, dtype=np.float32):
     """Return a loadshape dataframe representing all available data.
     This assumes that a loadshape has been selected in OpenDSS.
 
+    PMult values are stored as float32 (about 7 significant digits) by default
+    to halve the memory of long loadshapes. Pass dtype=np.float64 when the
+    values are exported or accumulated.
+
     Parameters
     ----------
     settings : SimulationSettingsModel
+    dtype : numpy dtype
 
     Returns
     -------
-    pd.DatetimeIndex
+    pd.DataFrame
 
     """
     start_time = settings.project.loadshape_start_time
-    data = dss.LoadShape.PMult()
     interval = timedelta(seconds=dss.LoadShape.SInterval())
     npts = dss.LoadShape.Npts()
-
-    indices = []
-    cur_time = start_time
-    for _ in range(npts):
-        indices.append(cur_time)
-        cur_time += interval
-
-    return pd.DataFrame(data, index=pd.DatetimeIndex(indices))
+    data = np.fromiter(dss.LoadShape.PMult(), dtype=dtype, count=npts)
+    indices = pd.date_range(start=start_time, periods=npts, freq=interval)
+    return pd.DataFrame(data.reshape(-1, 1), index=indices, copy=False)
 
 
-def create_loadshape_pmult_dataframe_for_simulation(settings: SimulationSettingsModel):
+def create_loadshape_pmult_dataframe_for_simulation(settings: SimulationSettingsModel, dtype=np.float32):
     """Return a loadshape pmult dataframe that only contains time points used
     by the simulation.
     This assumes that a loadshape has been selected in OpenDSS.
@@ -184,12 +219,34 @@ def create_loadshape_pmult_dataframe_for_simulation(settings: SimulationSettings
     Parameters
     ----------
     settings : SimulationSettingsModel
+    dtype : numpy dtype
+        See create_loadshape_pmult_dataframe.
 
     Returns
     -------
     pd.DataFrame
 
     """
-    df = create_loadshape_pmult_dataframe(settings)
+    df = create_loadshape_pmult_dataframe(settings, dtype=dtype)
+    start_time, end_time, step_time = create_time_range_from_settings(settings)
+    interval = timedelta(seconds=dss.LoadShape.SInterval())
+    offset = start_time - settings.project.loadshape_start_time
+
+    # When the simulation time points land on loadshape points, slice by position
+    # instead of looking up every timestamp.
+    if (
+        interval > timedelta(0)
+        and offset >= timedelta(0)
+        and offset % interval == timedelta(0)
+        and step_time % interval == timedelta(0)
+    ):
+        start_index = offset // interval
+        stride = step_time // interval
+        num_points = _get_num_time_points(start_time, end_time, step_time)
+        end_index = start_index + num_points * stride
+        if end_index - stride < len(df):
+            # Copy so the result does not keep the full loadshape alive.
+            return df.iloc[start_index:end_index:stride].copy()
+
     simulation_index = create_datetime_index_from_settings(settings)
     return df.loc[simulation_index]
@@ -48,30 +48,34 @@ def get_time_duration_string(seconds):
     return val
 
 
+_MAX_DURATION_NS = 2**63 - 1
+
+
 class TimerStats:
     """Tracks timing stats for one code block."""
     def __init__(self, name):
         self._name = name
         self._count = 0
-        self._max = 0.0
-        self._min = None
-        self._avg = 0.0
-        self._total = 0.0
+        # Durations are tracked in integer nanoseconds.
+        self._max = 0
+        self._min = _MAX_DURATION_NS
+        self._total = 0
 
     def get_stats(self):
-        """Get the current stats summary.
+        """Get the current stats summary. Durations are in seconds.
 
         Returns
         -------
         dict
 
         """
-        avg = 0 if self._count == 0 else self._total / self._count
+        if self._count == 0:
+            return {"min": None, "max": 0.0, "total": 0.0, "avg": 0, "count": 0}
         return {
-            "min": self._min,
-            "max": self._max,
-            "total": self._total,
-            "avg": avg,
+            "min": self._min / 1e9,
+            "max": self._max / 1e9,
+            "total": self._total / 1e9,
+            "avg": self._total / self._count / 1e9,
             "count": self._count,
         }
 
@@ -87,14 +91,18 @@ class TimerStats:
         )
         logger.info(f"TimerStats summary: {self._name}: {text}")
 
-    def update(self, duration):
-        """Update the stats with a new timing."""
+    def update(self, duration_ns):
+        """Update the stats with a new timing in nanoseconds."""
         self._count += 1
-        self._total += duration
-        if duration > self._max:
-            self._max = duration
-        if self._min is None or duration < self._min:
-            self._min = duration
+        self._total += duration_ns
+        if duration_ns > self._max:
+            self._max = duration_ns
+        if duration_ns < self._min:
+            self._min = duration_ns
+
+    def update_seconds(self, duration):
+        """Update the stats with a new timing in seconds."""
+        self.update(int(duration * 1e9))
 
 
 class Timer:
@@ -104,10 +112,10 @@ class Timer:
         self._timer_stat = timer_stats.get_stat(name)
 
     def __enter__(self):
-        self._start = time.perf_counter()
+        self._start = time.perf_counter_ns()
 
     def __exit__(self, exc, value, tb):
-        self._timer_stat.update(time.perf_counter() - self._start)
+        self._timer_stat.update(time.perf_counter_ns() - self._start)
 
 
 
@@ -1,7 +1,14 @@
 from pathlib import Path
 
+import mock
+import numpy as np
+from shapely.geometry import Point
+
 from pydss.common import SIMULATION_SETTINGS_FILENAME
 from pydss.pydss_project import PyDssProject
+from pydss.pyControllers.Controllers.PvVoltageRideThru import PvVoltageRideThru
+from pydss.pyControllers.enumerations import RideThroughCategory
+from pydss.pyControllers.models import MotorStallSettings, PvVoltageRideThruModel
 
 base_path = Path(__file__).parent.absolute()
 
@@ -39,4 +46,42 @@ def test_pv_controller():
     PyDssProject.run_project(
         pydss_project,
         simulation_file="simulation_pv_controller.toml",
-    )
\ No newline at end of file
+    )
+
+
+def test_voltage_ride_through_category_iii_regions():
+    controller = PvVoltageRideThru.__new__(PvVoltageRideThru)
+    controller.model = PvVoltageRideThruModel(ride_through_category=RideThroughCategory.CATEGORY_III)
+    controller._controlled_element = mock.MagicMock()
+
+    V, T = controller._create_operation_regions()
+    assert V == [1.10, 0.88, 0.5, 1.2, 1.2, 1.2, 0.0, 0.0]
+    assert T == [21, 10, 13, 13, 13, 1, 1]
+    assert controller._fault_counter_max == 3
+    assert controller._fault_counter_clearing_time_sec == 5
+    controller._controlled_element.SetParameter.assert_any_call("Vminpu", 0.88)
+    # Category III trips below 0.88 pu after 21 seconds (Category I allows down to 0.7 pu).
+    assert controller.trip_region.contains(Point(25, 0.8))
+    assert not controller.trip_region.contains(Point(15, 0.8))
+
+
+def test_from_trusted():
+    model = PvVoltageRideThruModel.from_trusted({"ride_through_category": RideThroughCategory.CATEGORY_III})
+    assert model.uv_1_pu == 0.88
+    assert model.uv_1_ct_sec == 21.0
+    assert model == PvVoltageRideThruModel(ride_through_category=RideThroughCategory.CATEGORY_III)
+
+    settings = MotorStallSettings.from_trusted({"t_th": 2.0})
+    assert settings == MotorStallSettings(t_th=2.0)
+    assert MotorStallSettings.from_trusted({}) == MotorStallSettings()
+
+
+def test_motor_stall_settings_to_array():
+    settings = MotorStallSettings(k_p1=1.5, x_stall_pu=0.2)
+    array = settings.to_array()
+    assert array.shape == (23,)
+    assert array.dtype == np.float64
+    expected = [getattr(settings, name) for name in MotorStallSettings.model_fields]
+    assert array.tolist() == expected
+    assert array[0] == 1.5
+    assert array[-1] == 0.2
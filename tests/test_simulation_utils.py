@@ -0,0 +1,168 @@
+import math
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pydss.simulation_input_models import (
+    create_simulation_settings,
+    load_simulation_settings
+)
+from pydss.utils import simulation_utils
+from pydss.utils.simulation_utils import (
+    CircularBufferHelper,
+    create_datetime_index_from_settings,
+    create_loadshape_pmult_dataframe,
+    create_loadshape_pmult_dataframe_for_simulation,
+)
+
+
+@pytest.fixture
+def simulation_settings(tmp_path):
+    filename = create_simulation_settings(tmp_path, "test_project", ["s1"])
+    settings = load_simulation_settings(filename)
+    settings.project.start_time = datetime(2020, 1, 1)
+    settings.project.loadshape_start_time = datetime(2020, 1, 1)
+    settings.project.step_resolution_sec = 900.0
+    return settings
+
+
+def test_circular_buffer_average():
+    buf = CircularBufferHelper(3)
+    buf.append(1.0)
+    buf.append(2.0)
+    assert math.isnan(buf.average())
+    buf.append(3.0)
+    assert len(buf) == 3
+    assert buf.average() == 2.0
+    buf.append(7.0)
+    assert len(buf) == 3
+    assert buf.average() == 4.0
+
+
+def test_circular_buffer_average_matches_window():
+    window_size = 5
+    values = np.random.default_rng(0).random(100)
+    buf = CircularBufferHelper(window_size)
+    for i, val in enumerate(values):
+        buf.append(val)
+        if i >= window_size - 1:
+            assert math.isclose(buf.average(), values[i - window_size + 1:i + 1].mean())
+
+
+def test_circular_buffer_average_recovers_from_nan():
+    buf = CircularBufferHelper(2)
+    buf.append(1.0)
+    buf.append(np.nan)
+    assert math.isnan(buf.average())
+    buf.append(3.0)
+    assert math.isnan(buf.average())
+    buf.append(5.0)
+    assert buf.average() == 4.0
+
+
+def test_circular_buffer_average_lists():
+    buf = CircularBufferHelper(2)
+    buf.append([1.0, 10.0])
+    assert len(buf) == 1
+    assert np.isnan(buf.average()).all()
+    buf.append([3.0, 20.0])
+    assert np.array_equal(buf.average(), [2.0, 15.0])
+    buf.append([5.0, 40.0])
+    assert len(buf) == 2
+    assert np.array_equal(buf.average(), [4.0, 30.0])
+
+
+def test_create_datetime_index_from_settings(simulation_settings):
+    simulation_settings.project.simulation_duration_min = 61.0
+    index = create_datetime_index_from_settings(simulation_settings)
+    expected = [datetime(2020, 1, 1) + timedelta(minutes=15 * i) for i in range(5)]
+    assert index.equals(pd.DatetimeIndex(expected))
+
+
+def test_create_datetime_index_from_settings_zero_duration(simulation_settings):
+    simulation_settings.project.simulation_duration_min = 0.0
+    index = create_datetime_index_from_settings(simulation_settings)
+    assert isinstance(index, pd.DatetimeIndex)
+    assert len(index) == 0
+
+
+PMULT = [i / 100 for i in range(96)]
+
+
+@pytest.fixture
+def loadshape(monkeypatch):
+    """Replace the OpenDSS loadshape with 96 points at a 15-minute interval."""
+    pmult = PMULT
+    load_shape = SimpleNamespace(SInterval=lambda: 900.0, Npts=lambda: len(pmult), PMult=lambda: pmult)
+    monkeypatch.setattr(simulation_utils, "dss", SimpleNamespace(LoadShape=load_shape))
+
+
+def test_create_loadshape_pmult_dataframe_dtype(simulation_settings, loadshape):
+    df = create_loadshape_pmult_dataframe(simulation_settings)
+    assert df.dtypes[0] == np.float32
+    assert df.index[0] == simulation_settings.project.loadshape_start_time
+
+    df = create_loadshape_pmult_dataframe(simulation_settings, dtype=np.float64)
+    assert df.dtypes[0] == np.float64
+    assert df.iloc[:, 0].tolist() == PMULT
+
+    simulation_settings.project.simulation_duration_min = 60.0
+    df = create_loadshape_pmult_dataframe_for_simulation(simulation_settings, dtype=np.float64)
+    assert df.dtypes[0] == np.float64
+    assert df.iloc[:, 0].tolist() == PMULT[:4]
+
+
+@pytest.mark.parametrize(
+    "start_offset_min, duration_min, step_sec",
+    [
+        (0, 1440, 900),   # aligned, whole loadshape
+        (60, 600, 900),   # offset start
+        (60, 600, 2700),  # stride > 1
+        (1425, 15, 900),  # last point
+        (0, 0, 900),      # zero duration
+        (0, 10, 1000),    # step not a multiple of the interval, falls back to .loc
+    ],
+)
+def test_create_loadshape_pmult_dataframe_for_simulation(
+    simulation_settings, loadshape, start_offset_min, duration_min, step_sec
+):
+    project = simulation_settings.project
+    project.start_time = project.loadshape_start_time + timedelta(minutes=start_offset_min)
+    project.simulation_duration_min = duration_min
+    project.step_resolution_sec = step_sec
+
+    df = create_loadshape_pmult_dataframe_for_simulation(simulation_settings)
+    expected = create_loadshape_pmult_dataframe(simulation_settings).loc[
+        create_datetime_index_from_settings(simulation_settings)
+    ]
+    pd.testing.assert_frame_equal(df, expected, check_freq=False)
+    # The result must not be a view that keeps the full loadshape alive.
+    values = df.iloc[:, 0].to_numpy()
+    root = values
+    while root.base is not None:
+        root = root.base
+    assert root.nbytes == values.nbytes
+
+
+@pytest.mark.parametrize(
+    "start_offset_min, duration_min, step_sec",
+    [
+        (7, 60, 900),     # start between loadshape points
+        (0, 60, 60),      # step shorter than the interval
+        (-15, 60, 900),   # starts before the loadshape
+        (1425, 30, 900),  # runs past the end of the loadshape
+    ],
+)
+def test_create_loadshape_pmult_dataframe_for_simulation_missing_points(
+    simulation_settings, loadshape, start_offset_min, duration_min, step_sec
+):
+    project = simulation_settings.project
+    project.start_time = project.loadshape_start_time + timedelta(minutes=start_offset_min)
+    project.simulation_duration_min = duration_min
+    project.step_resolution_sec = step_sec
+
+    with pytest.raises(KeyError):
+        create_loadshape_pmult_dataframe_for_simulation(simulation_settings)
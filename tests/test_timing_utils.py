@@ -0,0 +1,26 @@
+import math
+
+from pydss.utils.timing_utils import TimerStats
+
+
+def test_timer_stats():
+    stats = TimerStats("test")
+    assert stats.get_stats() == {"min": None, "max": 0.0, "total": 0.0, "avg": 0, "count": 0}
+
+    for duration_ns in (2_000_000, 1_000_000, 3_000_000):
+        stats.update(duration_ns)
+    result = stats.get_stats()
+    assert result["count"] == 3
+    assert math.isclose(result["min"], 0.001)
+    assert math.isclose(result["max"], 0.003)
+    assert math.isclose(result["total"], 0.006)
+    assert math.isclose(result["avg"], 0.002)
+
+
+def test_timer_stats_update_seconds():
+    stats1 = TimerStats("seconds")
+    stats1.update_seconds(0.5)
+    stats2 = TimerStats("nanoseconds")
+    stats2.update(500_000_000)
+    assert stats1.get_stats() == stats2.get_stats()
+    assert stats1.get_stats()["total"] == 0.5